@@ -6,6 +6,7 @@
 # avoiding headless fingerprint detection, navigator.webdriver checks, etc.
 #
 # Usage: execute.sh '{"url":"...","action":"read|screenshot|interact","selectors":[...]}'
+#        execute.sh '{"urls":["...","..."],"action":"read"}'   (tabs run concurrently)
 set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "${SCRIPT_DIR}/../../_common/lib.sh"
@@ -18,13 +19,20 @@ INPUT="${1:-}"
 [ -z "$INPUT" ] && error_exit "Usage: execute.sh '{\"url\":\"...\",\"action\":\"read|screenshot|interact\",\"selectors\":[...]}'"
 
 URL=$(echo "$INPUT" | jq -r '.url // empty')
+URLS_JSON=$(echo "$INPUT" | jq -c '.urls // []')
 ACTION=$(echo "$INPUT" | jq -r '.action // "read"')
 SELECTORS_JSON=$(echo "$INPUT" | jq -c '.selectors // []')
 WAIT_FOR=$(echo "$INPUT" | jq -r '.waitFor // empty')
 WAIT_TIMEOUT=$(echo "$INPUT" | jq -r '.waitTimeout // empty')
+NO_IMAGES=$(echo "$INPUT" | jq -r '.noImages // false')
+PARALLEL_CLICKS=$(echo "$INPUT" | jq -r '.parallelClicks // false')
+FULL_RISK_SCAN=$(echo "$INPUT" | jq -r '.fullRiskScan // false')
 CDP_PORT_OVERRIDE=$(echo "$INPUT" | jq -r '.cdpPort // empty')
 
-require_param "url" "$URL"
+URLS_COUNT=$(echo "$URLS_JSON" | jq 'length')
+if [ "$URLS_COUNT" -eq 0 ]; then
+  require_param "url" "$URL"
+fi
 
 [ -n "$CDP_PORT_OVERRIDE" ] && CDP_PORT="$CDP_PORT_OVERRIDE"
 
@@ -37,6 +45,8 @@ ensure_patchright() {
     echo '{"status":"creating_venv","path":"'"$VENV_DIR"'"}' >&2
     python3 -m venv "$VENV_DIR" \
       || error_exit "Failed to create Python venv at $VENV_DIR"
+    # orjson is optional (faster JSON output); tried once, stdlib json otherwise
+    "$VENV_DIR/bin/pip" install orjson >/dev/null 2>&1 || true
   fi
 
   # Install patchright if not present in venv
@@ -51,11 +61,24 @@ ensure_patchright() {
 # Build python command args
 # ---------------------------------------------------------------------------
 build_args() {
-  local args=("--url" "$URL" "--action" "$ACTION" "--cdp-port" "$CDP_PORT")
+  local args=("--action" "$ACTION" "--cdp-port" "$CDP_PORT")
+
+  [ -n "$URL" ] && args+=("--url" "$URL")
+
+  # Parse urls array into individual --urls args
+  if [ "$URLS_COUNT" -gt 0 ]; then
+    args+=("--urls")
+    for i in $(seq 0 $((URLS_COUNT - 1))); do
+      args+=("$(echo "$URLS_JSON" | jq -r ".[$i]")")
+    done
+  fi
 
   # Add wait-for selector if specified
   [ -n "$WAIT_FOR" ] && args+=("--wait-for" "$WAIT_FOR")
   [ -n "$WAIT_TIMEOUT" ] && args+=("--wait-timeout" "$WAIT_TIMEOUT")
+  [ "$NO_IMAGES" = "true" ] && args+=("--no-images")
+  [ "$PARALLEL_CLICKS" = "true" ] && args+=("--parallel-clicks")
+  [ "$FULL_RISK_SCAN" = "true" ] && args+=("--full-risk-scan")
 
   # Parse selectors array into individual --selectors args
   local count
@@ -15,24 +15,199 @@ CRITICAL CDP MODE RULES (violations cause silent failures):
 """
 
 import argparse
+import asyncio
+import functools
 import http.client
 import json
 import os
+import pathlib
 import random
+import re
+import socket
 import subprocess
 import sys
 import time
 
+try:
+    import orjson  # Optional: C/SIMD serializer, noticeably faster on large results
+except ImportError:
+    orjson = None
+
 # Bypass macOS proxy tools (ClashX, Surge) that hijack urllib
 os.environ["no_proxy"] = "localhost,127.0.0.1"
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CDP_PORT = 9222
-SCREENSHOT_DIR = os.path.expanduser("~/.crewly/screenshots")
+CHROME_LAUNCH_TIMEOUT_S = 30
+CDP_POLL_INTERVAL_S = 0.05
+SCREENSHOT_DIR = pathlib.Path("~/.crewly/screenshots").expanduser()
+SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+# JPEG encodes far faster than PNG and is plenty for vision-model input
+SCREENSHOT_QUALITY = 80
+DAEMON_SOCKET = os.path.expanduser("~/.crewly/stealth.sock")
+# Longer than the skill's 120 s timeoutMs, so a slow action is never cut short
+# by the client; a wedged daemon still can't hang it forever.
+DAEMON_REPLY_TIMEOUT_S = 150
+# Request lines may carry many URLs and selectors; asyncio's default is 64 KiB
+DAEMON_LINE_LIMIT = 1 << 20
+
+# Requests dropped before fetching. Text extraction never needs media, and
+# analytics SDKs only add network noise. Media is matched by CDP resource type
+# (extensionless CDN URLs included, the page document never); trackers by URL
+# patterns (CDP wildcard syntax) anchored to their hostnames.
+BLOCKED_RESOURCE_TYPES = ["Image", "Media", "Font"]
+BLOCKED_TRACKER_PATTERNS = [
+    "*://*.googletagmanager.com/*",
+    "*://*.google-analytics.com/*",
+    "*://*.doubleclick.net/*",
+]
+
+RISK_KEYWORDS = [
+    "验证码", "滑块验证", "人机验证", "操作频繁",
+    "captcha", "verify you are human", "rate limit",
+    "too many requests", "access denied", "you have been blocked",
+    "your account has been locked", "suspicious activity",
+]
+# One compiled alternation so page text is scanned once (in C) rather than
+# once per keyword. The zero-width lookahead tries every position, so
+# overlapping keywords ("滑块验证码" holds both 滑块验证 and 验证码) all match.
+_RISK_KEYWORDS_BY_LOWER = {kw.lower(): kw for kw in RISK_KEYWORDS}
+_RISK_RE = re.compile("(?=(" + "|".join(re.escape(kw) for kw in _RISK_KEYWORDS_BY_LOWER) + "))")
+_RISK_URL_RE = re.compile(r"captcha|verify|challenge", re.IGNORECASE)
+# Visible text pulled over CDP for the keyword scan. Risk-control banners sit
+# in the first screen, so only the head of the page is scanned unless a full
+# scan is requested.
+RISK_SCAN_CHARS = 65536
+RISK_TEXT_MAX_CHARS = 200000
+
+# Readiness heuristic used instead of networkidle when no --wait-for is given
+PAGE_READY_JS = "() => document.readyState === 'complete' && !!document.body && document.body.innerText.length > 100"
+PAGE_READY_TIMEOUT_MS = 8000
+
+# Heuristic containers for the main content when no selectors are given
+# (document.body is the built-in last resort, so it isn't listed)
+MAIN_CONTENT_SELECTORS = ["article", "main", "[role='main']", ".content", "#content"]
+CONTENT_MAX_CHARS = 10000
+
+# In-page extractors — each does all its DOM lookups in one CDP round-trip
+_EXTRACT_SELECTORS_JS = """(sels) => Object.fromEntries(sels.map((s) => {
+  try {
+    const e = document.querySelector(s);
+    return [s, e ? e.innerText : null];
+  } catch (err) {
+    return [s, `error: ${err.message}`];
+  }
+}))"""
+# Returns the full text — JS slice() counts UTF-16 units and can split an
+# emoji's surrogate pair, so the CONTENT_MAX_CHARS cap is applied in Python.
+_EXTRACT_MAIN_CONTENT_JS = """(sels) => {
+  const seen = new Set();  // e.g. <main role="main"> matches twice; innerText forces layout
+  for (const s of sels) {
+    const e = document.querySelector(s);
+    if (!e || seen.has(e)) continue;
+    seen.add(e);
+    const t = e.innerText;
+    if (t.length > 50) return t;
+  }
+  return document.body ? document.body.innerText : "";
+}"""
+
+# Scrolls the first match to the viewport centre. "instant" overrides CSS
+# scroll-behavior: smooth, which would leave the element still moving.
+_SCROLL_TO_CLICK_TARGET_JS = """(s) => {
+  const e = document.querySelector(s);
+  if (!e) return "not_found";
+  e.scrollIntoView({block: "center", inline: "center", behavior: "instant"});
+  return "ok";
+}"""
+# Measures the (already scrolled) target and checks nothing covers its centre
+_CLICK_POINT_JS = """(s) => {
+  const e = document.querySelector(s);
+  if (!e) return {action: "not_found"};
+  const r = e.getBoundingClientRect();
+  if (r.width === 0 || r.height === 0) return {action: "not_visible"};
+  const x = r.left + r.width / 2, y = r.top + r.height / 2;
+  const hit = document.elementFromPoint(x, y);
+  if (!hit || (hit !== e && !e.contains(hit))) return {action: "obscured"};
+  return {x, y};
+}"""
+
+# Keep-alive HTTP connection to Chrome's /json/version endpoint
+_CDP_CONN = None
+
+# Warm CDP connection, kept at module level so daemon mode can reuse it
+# across requests and with_reconnect() can swap it out after a drop.
+_PW = None
+_BROWSER = None
+_CONTEXT = None
+_BROWSER_PORT = CDP_PORT
+
+# Idle tabs kept between requests, keyed by context. Only the daemon turns
+# pooling on — a one-shot CLI run has nothing to reuse them for.
+PAGE_POOL_MAX_IDLE = 4
+PAGE_POOL_MAX_USES = 50
+_POOL_PAGES = False
+_PAGE_POOL = {}
+_PAGE_USES = {}
+_CDP_SESSIONS = {}
+
+RECONNECT_RETRIES = 5
+RECONNECT_MAX_BACKOFF_S = 10
+_RECONNECT_LOCK = None  # Created inside the running loop (Python 3.9 binds locks at creation)
+
+
+# ── Output ──────────────────────────────────────────────────────
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode()
+
+
+def dump_result(result: dict, indent: bool = False) -> bytes:
+    """Serialize an action result, degrading to an error result if it can't be encoded."""
+    try:
+        return dump_json(result, indent)
+    except Exception as e:
+        return dump_json({"success": False, "error": f"serialize_failed: {e}"}, indent)
+
+
+def emit(obj, indent: bool = False):
+    """Write one JSON document to stdout."""
+    sys.stdout.buffer.write(dump_result(obj, indent) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 # ── CDP connection helpers ──────────────────────────────────────
 
+def _close_cdp_conn():
+    global _CDP_CONN
+    if _CDP_CONN is not None:
+        _CDP_CONN.close()
+        _CDP_CONN = None
+
+
+def _fetch_ws_url(port: int) -> str:
+    global _CDP_CONN
+    if _CDP_CONN is None or _CDP_CONN.port != port:
+        _close_cdp_conn()
+        _CDP_CONN = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+
+    try:
+        _CDP_CONN.request("GET", "/json/version")
+        resp = _CDP_CONN.getresponse()
+        body = resp.read()  # Always drain so the connection can be reused
+    except Exception:
+        _close_cdp_conn()
+        raise
+
+    if resp.status != 200:
+        raise ConnectionError(f"CDP returned HTTP {resp.status}")
+    return json.loads(body.decode())["webSocketDebuggerUrl"]
+
+
 def get_ws_url(port: int = CDP_PORT) -> str:
     """
     Manually fetch the WebSocket URL from Chrome's CDP endpoint.
@@ -40,87 +215,157 @@ def get_ws_url(port: int = CDP_PORT) -> str:
     Uses http.client.HTTPConnection (NOT urllib) to avoid macOS proxy
     tool interference. Note: NO trailing slash on /json/version
     (Patchright 1.58 + Chrome 144 trailing slash bug).
+
+    The connection is kept alive at module level, so repeated calls (daemon
+    mode, launch polling) skip the TCP handshake.
     """
-    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
     try:
-        conn.request("GET", "/json/version")
-        resp = conn.getresponse()
-        if resp.status != 200:
-            raise ConnectionError(f"CDP returned HTTP {resp.status}")
-        data = json.loads(resp.read().decode())
-        return data["webSocketDebuggerUrl"]
-    finally:
-        conn.close()
+        return _fetch_ws_url(port)
+    except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+        # Chrome dropped the idle keep-alive socket — reopen once
+        return _fetch_ws_url(port)
 
 
-def ensure_chrome_running() -> str:
-    """Launch Chrome via the launcher script if CDP is not responding."""
+def start_chrome(port: int = CDP_PORT):
+    """
+    Start the Chrome launcher script in the background if CDP is not responding.
+
+    Returns immediately — the launcher process, or None if Chrome is already
+    up — so slow start-up work (importing patchright) can overlap the launch.
+    """
     try:
-        return get_ws_url()
+        get_ws_url(port)
+        return None
     except Exception:
         pass
 
     launcher = os.path.join(SCRIPT_DIR, "launch-chrome-cdp.sh")
-    result = subprocess.run(
-        ["bash", launcher, str(CDP_PORT)],
-        capture_output=True, text=True, timeout=30
+    return subprocess.Popen(
+        ["bash", launcher, str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
     )
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to launch Chrome: {result.stderr}")
 
-    ws_url = result.stdout.strip().split("\n")[-1]
-    if ws_url.startswith("ws://"):
-        return ws_url
 
-    return get_ws_url()
+def wait_for_ws(port: int = CDP_PORT, launcher=None, timeout_s: float = CHROME_LAUNCH_TIMEOUT_S) -> str:
+    """Poll /json/version until Chrome answers, failing early if the launcher does."""
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            ws_url = get_ws_url(port)
+        except Exception:
+            pass
+        else:
+            if launcher is not None:
+                # The launcher exits right after it sees CDP too; reap it and
+                # close its stderr pipe so reconnects don't leak fds/zombies.
+                try:
+                    launcher.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    launcher.kill()  # Chrome is already up; the script itself is expendable
+                    launcher.communicate()
+            return ws_url
+
+        if launcher is not None and launcher.poll() not in (None, 0):
+            _, stderr = launcher.communicate()
+            raise RuntimeError(f"Failed to launch Chrome: {stderr}")
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"Chrome CDP not responding on port {port} after {timeout_s}s")
+        time.sleep(CDP_POLL_INTERVAL_S)
+
+
+def ensure_chrome_running(port: int = CDP_PORT) -> str:
+    """Launch Chrome via the launcher script if CDP is not responding."""
+    return wait_for_ws(port, start_chrome(port))
+
+
+def disconnect_errors() -> tuple:
+    """Exception types that may mean the CDP link went away (or just one tab did)."""
+    from patchright._impl._errors import TargetClosedError
+    return (TargetClosedError, ConnectionError)
+
+
+def link_is_up(browser) -> bool:
+    """True while the CDP WebSocket to `browser` is still open."""
+    return browser is not None and browser.is_connected()
 
 
 # ── Human-like behavior helpers ─────────────────────────────────
 
-def human_delay(min_s: float = 0.5, max_s: float = 2.0):
+# Unit jitter values drawn in batches, so each human_* call is usually a
+# multiply-add rather than a fresh RNG draw. The batch is redrawn whenever it
+# runs out, so timings never replay as a fixed cycle.
+_JITTER = [0.0] * 8192
+_JITTER_POS = len(_JITTER)  # Exhausted: the first call draws
+
+
+def _jitter(lo: float, hi: float) -> float:
+    """Next batched random value scaled into [lo, hi)."""
+    global _JITTER_POS
+    if _JITTER_POS == len(_JITTER):
+        _JITTER[:] = [random.random() for _ in _JITTER]
+        _JITTER_POS = 0
+    value = _JITTER[_JITTER_POS]
+    _JITTER_POS += 1
+    return lo + (hi - lo) * value
+
+
+async def human_delay(min_s: float = 0.5, max_s: float = 2.0):
     """Random delay to simulate human hesitation."""
-    time.sleep(random.uniform(min_s, max_s))
+    await asyncio.sleep(_jitter(min_s, max_s))
 
 
-def human_scroll(page, direction: str = "down", amount: int = 0):
+async def human_scroll(page, direction: str = "down", amount: int = 0):
     """Scroll with natural, variable distances."""
     if amount == 0:
-        amount = random.randint(200, 600)
+        amount = int(_jitter(200, 601))
     delta = amount if direction == "down" else -amount
-    page.mouse.wheel(0, delta)
-    human_delay(0.3, 1.0)
+    await page.mouse.wheel(0, delta)
+    await human_delay(0.3, 1.0)
 
 
-def human_type(page, selector: str, text: str):
-    """Type text with variable inter-key delays."""
-    page.click(selector)
-    human_delay(0.2, 0.5)
-    for char in text:
-        page.keyboard.type(char)
-        time.sleep(random.uniform(0.05, 0.15))
+async def human_type(page, selector: str, text: str, fast: bool = False):
+    """
+    Type text with variable inter-key delays.
+
+    The whole string goes to the driver in one keyboard.type() call; its
+    `delay` (ms) spaces out the key events without a round-trip per char.
+    Pass fast=True for fields where typing cadence doesn't matter — the
+    value is then set with a single page.fill().
+    """
+    if fast:
+        await page.fill(selector, text)
+        return
+    await page.click(selector)
+    await human_delay(0.2, 0.5)
+    await page.keyboard.type(text, delay=_jitter(50, 150))
 
 
 # ── Risk control detection ──────────────────────────────────────
 
-def detect_risk_control(page) -> dict:
-    """Check if the page is showing CAPTCHA or rate-limit signals."""
+async def detect_risk_control(page, url: str, full_scan: bool = False) -> dict:
+    """
+    Check if the page is showing CAPTCHA or rate-limit signals.
+
+    `url` is the page's current URL, captured once by the caller. Scans the
+    first RISK_SCAN_CHARS of visible text; full_scan widens that to
+    RISK_TEXT_MAX_CHARS.
+    """
     signals = []
 
-    url = page.url.lower()
-    if "captcha" in url or "verify" in url or "challenge" in url:
+    if _RISK_URL_RE.search(url):
         signals.append("captcha_url")
 
     try:
-        content = page.content()
-        risk_keywords = [
-            "验证码", "滑块验证", "人机验证", "操作频繁",
-            "captcha", "verify you are human", "rate limit",
-            "too many requests", "access denied", "you have been blocked",
-            "your account has been locked", "suspicious activity",
-        ]
-        content_lower = content.lower()
-        for kw in risk_keywords:
-            if kw.lower() in content_lower:
+        # Visible text only — skips <script>/<style> bodies, SVG and inline
+        # data that page.content() would serialize over CDP. Sliced in the
+        # page, so neither the transfer nor lower() touches the rest.
+        content = await page.evaluate(
+            "(n) => (document.body ? document.body.innerText : '').slice(0, n)",
+            RISK_TEXT_MAX_CHARS if full_scan else RISK_SCAN_CHARS,
+        )
+        found = set(_RISK_RE.findall(content.lower()))
+        for kw_lower, kw in _RISK_KEYWORDS_BY_LOWER.items():
+            if kw_lower in found:
                 signals.append(f"keyword:{kw}")
     except Exception:
         pass
@@ -131,28 +376,113 @@ def detect_risk_control(page) -> dict:
     }
 
 
-# ── Core actions ────────────────────────────────────────────────
+# ── Navigation ──────────────────────────────────────────────────
+
+def _discard_result(task: asyncio.Task):
+    """Done-callback that retrieves a background task's outcome so it isn't logged."""
+    if not task.cancelled():
+        task.exception()
 
-def action_read(page, url: str, selectors: list, wait_for: str = None, wait_timeout: int = 15000) -> dict:
-    """Navigate to URL, extract text content from selectors."""
-    page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-    # For SPA sites (X.com, React apps), wait for JS to finish rendering
+async def _fail_paused_request(cdp, event: dict):
     try:
-        page.wait_for_load_state("networkidle", timeout=15000)
+        await cdp.send("Fetch.failRequest", {"requestId": event["requestId"], "errorReason": "BlockedByClient"})
     except Exception:
-        pass  # Best effort — some SPAs never fully idle
+        pass  # Tab navigated away or closed meanwhile
+
+
+async def _cdp_session(page):
+    """Per-tab CDP session, created once and cached for the tab's lifetime."""
+    cdp = _CDP_SESSIONS.get(page)
+    if cdp is None:
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        # Coroutine handler: the event emitter schedules it and keeps the task alive
+        cdp.on("Fetch.requestPaused", functools.partial(_fail_paused_request, cdp))
+        _CDP_SESSIONS[page] = cdp
+    return cdp
+
+
+async def block_resources(page):
+    """
+    Make the browser drop images, fonts, media and trackers for this tab.
+
+    Trackers go through Network.setBlockedURLs, which Chrome enforces itself.
+    Media is intercepted with Fetch patterns filtered by resource type, so only
+    those requests pause for a failRequest — documents, scripts and XHR never
+    do, unlike a catch-all page.route().
+    """
+    cdp = await _cdp_session(page)
+    await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_TRACKER_PATTERNS})
+    await cdp.send("Fetch.enable", {"patterns": [
+        {"urlPattern": "*", "resourceType": t, "requestStage": "Request"} for t in BLOCKED_RESOURCE_TYPES
+    ]})
+
+
+async def unblock_resources(page):
+    """Lift block_resources() so a pooled tab starts the next request clean."""
+    cdp = _CDP_SESSIONS.get(page)
+    if cdp is not None:
+        await cdp.send("Fetch.disable")
+        await cdp.send("Network.setBlockedURLs", {"urls": []})
 
-    # Wait for a specific selector if requested
+
+async def navigate(page, url: str, wait_for: str = None, wait_timeout: int = 15000, settle: bool = True):
+    """
+    Load `url` and wait until it is ready to read.
+
+    With `wait_for`, the rest of the load and the selector wait run
+    concurrently and we return as soon as the selector resolves (or gives
+    up). The race only starts once the navigation has committed, so a
+    selector like `body` can't match the tab's previous (blank) document.
+    Otherwise, when `settle` is set, wait for a lightweight DOM-ready
+    heuristic — not networkidle, which ad-heavy and polling SPAs never reach,
+    so it always burned its full timeout.
+    """
     if wait_for:
+        await page.goto(url, wait_until="commit", timeout=60000)
+        load_task = asyncio.create_task(page.wait_for_load_state("domcontentloaded", timeout=60000))
+        sel_task = asyncio.create_task(page.wait_for_selector(wait_for, timeout=wait_timeout))
+        done, _ = await asyncio.wait([load_task, sel_task], return_when=asyncio.FIRST_COMPLETED)
+        if sel_task in done and sel_task.exception() is None:
+            # Target node is rendered — let the load finish in the background
+            load_task.add_done_callback(_discard_result)
+            return
+
+        try:
+            await load_task
+        except Exception:
+            sel_task.cancel()
+            sel_task.add_done_callback(_discard_result)
+            raise
         try:
-            page.wait_for_selector(wait_for, timeout=wait_timeout)
+            await sel_task
         except Exception:
             pass  # Continue even if wait_for times out — best effort
+        return
 
-    human_delay(1.0, 3.0)
+    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+    if not settle:
+        return
+
+    # For SPA sites (X.com, React apps), wait until JS has rendered some text
+    try:
+        await page.wait_for_function(PAGE_READY_JS, timeout=PAGE_READY_TIMEOUT_MS)
+    except Exception:
+        pass  # Best effort — some pages never render much text
 
-    risk = detect_risk_control(page)
+
+# ── Core actions ────────────────────────────────────────────────
+
+async def action_read(page, url: str, selectors: list, wait_for: str = None, wait_timeout: int = 15000,
+                      full_risk_scan: bool = False) -> dict:
+    """Navigate to URL, extract text content from selectors."""
+    await block_resources(page)
+    await navigate(page, url, wait_for, wait_timeout)
+    await human_delay(1.0, 3.0)
+
+    page_url = page.url
+    risk = await detect_risk_control(page, page_url, full_risk_scan)
     if risk["detected"]:
         return {
             "success": False,
@@ -161,49 +491,31 @@ def action_read(page, url: str, selectors: list, wait_for: str = None, wait_time
             "advice": "Stop immediately. Risk control triggered.",
         }
 
-    results = {}
     if not selectors:
-        # Extract main content heuristically
-        for sel in ["article", "main", "[role='main']", ".content", "#content", "body"]:
-            try:
-                el = page.query_selector(sel)
-                if el:
-                    text = el.inner_text()
-                    if len(text) > 50:
-                        results["content"] = text[:10000]
-                        break
-            except Exception:
-                continue
-        if not results:
-            results["content"] = page.inner_text("body")[:10000]
+        # Extract main content heuristically — whole cascade runs in the page
+        content = await page.evaluate(_EXTRACT_MAIN_CONTENT_JS, MAIN_CONTENT_SELECTORS)
+        results = {"content": content[:CONTENT_MAX_CHARS]}
     else:
-        for sel in selectors:
-            try:
-                el = page.query_selector(sel)
-                results[sel] = el.inner_text() if el else None
-            except Exception as e:
-                results[sel] = f"error: {e}"
+        results = await page.evaluate(_EXTRACT_SELECTORS_JS, list(dict.fromkeys(selectors)))
 
     return {
         "success": True,
-        "url": page.url,
-        "title": page.title(),
+        "url": page_url,
+        "title": await page.title(),
         "results": results,
     }
 
 
-def action_screenshot(page, url: str) -> dict:
-    """Navigate and take a screenshot."""
-    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+async def action_screenshot(page, url: str, no_images: bool = False, full_risk_scan: bool = False) -> dict:
+    """Navigate and take a screenshot (optionally without images/fonts/media)."""
+    if no_images:
+        await block_resources(page)
 
-    page.goto(url, wait_until="domcontentloaded", timeout=60000)
-    try:
-        page.wait_for_load_state("networkidle", timeout=15000)
-    except Exception:
-        pass
-    human_delay(1.5, 3.0)
+    await navigate(page, url)
+    await human_delay(1.5, 3.0)
 
-    risk = detect_risk_control(page)
+    page_url = page.url
+    risk = await detect_risk_control(page, page_url, full_risk_scan)
     if risk["detected"]:
         return {
             "success": False,
@@ -211,26 +523,59 @@ def action_screenshot(page, url: str) -> dict:
             "signals": risk["signals"],
         }
 
-    timestamp = int(time.time())
-    filename = f"stealth_{timestamp}.png"
-    filepath = os.path.join(SCREENSHOT_DIR, filename)
+    # Nanosecond timestamp: concurrent tabs can finish within the same second
+    filepath = SCREENSHOT_DIR / f"stealth_{time.time_ns()}.jpg"
 
-    page.screenshot(path=filepath, full_page=False)
+    await page.screenshot(path=filepath, type="jpeg", quality=SCREENSHOT_QUALITY, full_page=False)
 
     return {
         "success": True,
-        "url": page.url,
-        "title": page.title(),
-        "screenshot": filepath,
+        "url": page_url,
+        "title": await page.title(),
+        "screenshot": str(filepath),
     }
 
 
-def action_interact(page, url: str, selectors: list) -> dict:
-    """Navigate and interact with elements (click, scroll)."""
-    page.goto(url, wait_until="domcontentloaded", timeout=60000)
-    human_delay(1.0, 2.5)
+async def click_one(page, sel: str, pointer_lock: asyncio.Lock) -> dict:
+    """
+    Scroll an element into view and click it with human-like pauses.
+
+    Scroll and measurement are plain evaluates (no ElementHandle to create
+    and drive). The element is measured after the pause, and only clicked if
+    it is what sits under its centre point — a cookie overlay on top reports
+    "obscured" rather than a false success. The click goes through
+    page.mouse so Chrome dispatches trusted input; an in-page
+    element.click() would fire isTrusted=false events. `pointer_lock` keeps
+    concurrent clicks from scrolling under each other.
+    """
+    try:
+        async with pointer_lock:
+            if await page.evaluate(_SCROLL_TO_CLICK_TARGET_JS, sel) == "not_found":
+                return {"selector": sel, "action": "not_found", "success": False}
+            await human_delay(0.3, 0.8)
+            point = await page.evaluate(_CLICK_POINT_JS, sel)
+            if "action" in point:
+                return {"selector": sel, "action": point["action"], "success": False}
+            await page.mouse.click(point["x"], point["y"])
+        await human_delay(0.5, 1.5)
+        return {"selector": sel, "action": "clicked", "success": True}
+    except Exception as e:
+        return {"selector": sel, "action": "error", "error": str(e), "success": False}
+
+
+async def action_interact(page, url: str, selectors: list, ordered: bool = True,
+                          full_risk_scan: bool = False) -> dict:
+    """
+    Navigate and interact with elements (click, scroll).
+
+    Clicks run one after another by default, since a click often changes the
+    DOM the next selector targets. With ordered=False (independent regions,
+    e.g. a cookie banner and a nav tab) they run concurrently.
+    """
+    await navigate(page, url, settle=False)
+    await human_delay(1.0, 2.5)
 
-    risk = detect_risk_control(page)
+    risk = await detect_risk_control(page, page.url, full_risk_scan)
     if risk["detected"]:
         return {
             "success": False,
@@ -238,93 +583,417 @@ def action_interact(page, url: str, selectors: list) -> dict:
             "signals": risk["signals"],
         }
 
-    results = []
-    for sel in selectors:
-        try:
-            el = page.query_selector(sel)
-            if el:
-                el.scroll_into_view_if_needed()
-                human_delay(0.3, 0.8)
-                el.click()
-                human_delay(0.5, 1.5)
-                results.append({"selector": sel, "action": "clicked", "success": True})
-            else:
-                results.append({"selector": sel, "action": "not_found", "success": False})
-        except Exception as e:
-            results.append({"selector": sel, "action": "error", "error": str(e), "success": False})
+    pointer_lock = asyncio.Lock()
+    if ordered:
+        results = [await click_one(page, sel, pointer_lock) for sel in selectors]
+    else:
+        results = await asyncio.gather(*[click_one(page, sel, pointer_lock) for sel in selectors])
+
+    # Clicks have been sent — a disconnect from here on must not surface to
+    # with_reconnect(), which would replay them (e.g. toggling a like twice).
+    try:
+        title = await page.title()
+    except disconnect_errors() as e:
+        return {
+            "success": False,
+            "error": f"cdp_disconnected: {e}",
+            "interactions": results,
+            "advice": "Not retried — some clicks may already have been applied.",
+        }
 
     return {
         "success": True,
         "url": page.url,
-        "title": page.title(),
+        "title": title,
         "interactions": results,
     }
 
 
+# ── Page pool ───────────────────────────────────────────────────
+
+async def acquire_page(context):
+    """Take an idle tab from the pool, or open a new one."""
+    pool = _PAGE_POOL.get(context, [])
+    while pool:
+        page = pool.pop()
+        if not page.is_closed():
+            return page
+        _forget_page(page)
+    return await context.new_page()
+
+
+def _forget_page(page):
+    _PAGE_USES.pop(page, None)
+    _CDP_SESSIONS.pop(page, None)
+
+
+async def close_page(page):
+    """Close a tab and drop its pool bookkeeping."""
+    _forget_page(page)
+    try:
+        await page.close()
+    except Exception:
+        pass  # Tab already gone with the connection
+
+
+async def release_page(context, page):
+    """
+    Return a tab to the pool after a request.
+
+    The tab is reset to about:blank with any resource blocking lifted. It is
+    closed instead when pooling is off, the pool is full, or it has served
+    PAGE_POOL_MAX_USES requests.
+    """
+    uses = _PAGE_USES.get(page, 0) + 1
+    pool = _PAGE_POOL.setdefault(context, [])
+    if not _POOL_PAGES or page.is_closed() or uses >= PAGE_POOL_MAX_USES or len(pool) >= PAGE_POOL_MAX_IDLE:
+        await close_page(page)
+        return
+
+    try:
+        await unblock_resources(page)
+        await page.goto("about:blank")
+    except Exception:
+        await close_page(page)
+        return
+
+    _PAGE_USES[page] = uses
+    pool.append(page)
+
+
+async def drain_page_pool():
+    """Close every idle tab so none are left behind in the user's Chrome."""
+    for pool in _PAGE_POOL.values():
+        for page in pool:
+            await close_page(page)
+    reset_page_pool()
+
+
+def reset_page_pool():
+    """Forget pooled tabs — they belong to a connection that is gone."""
+    _PAGE_POOL.clear()
+    _PAGE_USES.clear()
+    _CDP_SESSIONS.clear()
+
+
+# ── Request dispatch ────────────────────────────────────────────
+
+async def run_action(context, action: str, url: str, request: dict) -> dict:
+    """Run one action in a pooled tab on the shared context."""
+    full_risk_scan = request.get("full_risk_scan", False)
+    page = await acquire_page(context)
+    try:
+        if action == "read":
+            return await action_read(page, url, request.get("selectors") or [],
+                                     request.get("wait_for"), request.get("wait_timeout", 15000),
+                                     full_risk_scan=full_risk_scan)
+        elif action == "screenshot":
+            return await action_screenshot(page, url, request.get("no_images", False),
+                                           full_risk_scan=full_risk_scan)
+        elif action == "interact":
+            return await action_interact(page, url, request.get("selectors") or [],
+                                         not request.get("parallel_clicks", False),
+                                         full_risk_scan=full_risk_scan)
+        else:
+            return {"success": False, "error": f"unknown_action: {action}"}
+    except Exception as e:
+        if isinstance(e, disconnect_errors()) and not link_is_up(context.browser):
+            raise  # Whole connection is gone — let with_reconnect() recover it
+        return {"success": False, "error": str(e)}  # Incl. just this tab being closed
+    finally:
+        await release_page(context, page)
+
+
+async def run_action_with_reconnect(action: str, url: str, request: dict) -> dict:
+    """Run one URL's action, reconnecting (and retrying only that URL) if the link drops."""
+    try:
+        return await with_reconnect(lambda context: run_action(context, action, url, request))
+    except Exception as e:
+        return {"success": False, "error": f"cdp_disconnected: {e}"}
+
+
+async def run_request(request: dict) -> dict:
+    """
+    Run one request (as built by main() or sent to the daemon).
+
+    Every URL gets its own tab on the shared context and they are driven
+    concurrently; a single URL returns its action result unwrapped. Each URL
+    is retried on its own after a reconnect, so a finished tab's result (and
+    clicks) are never replayed because another tab lost the link.
+    """
+    urls = ([request["url"]] if request.get("url") else []) + list(request.get("urls") or [])
+    if not urls:
+        return {"success": False, "error": "missing_url"}
+
+    action = request.get("action", "read")
+    results = await asyncio.gather(*[
+        asyncio.create_task(run_action_with_reconnect(action, url, request))
+        for url in urls
+    ])
+
+    if len(results) == 1:
+        return results[0]
+    return {
+        "success": all(r.get("success") for r in results),
+        "pages": results,
+    }
+
+
+async def connect_browser(pw, ws_url: str, port: int = CDP_PORT):
+    """Connect over CDP and keep the browser + default context at module level."""
+    global _PW, _BROWSER, _CONTEXT, _BROWSER_PORT
+    _PW, _BROWSER_PORT = pw, port
+    _BROWSER = await pw.chromium.connect_over_cdp(ws_url)
+    reset_page_pool()
+    # CRITICAL: Use Chrome's existing default context, NOT new_context()
+    contexts = _BROWSER.contexts
+    _CONTEXT = contexts[0] if contexts else None
+    return _CONTEXT
+
+
+async def with_reconnect(fn, retries: int = RECONNECT_RETRIES):
+    """
+    Run `fn(context)`, reconnecting over CDP if the WebSocket drops.
+
+    Chrome restarts, laptop sleep or WSL2 packet loss kill the connection
+    mid-session. Instead of failing every later call, back off with full
+    jitter (0..min(2^n, 10) s), make sure Chrome is up, reconnect and retry.
+    Errors while the link is still up (a tab closed by the site or user) are
+    not retried — re-navigating a risk-controlled site would only make it worse.
+    """
+    global _RECONNECT_LOCK
+    if _RECONNECT_LOCK is None:
+        _RECONNECT_LOCK = asyncio.Lock()
+
+    for attempt in range(retries + 1):
+        browser = _BROWSER
+        try:
+            return await fn(_CONTEXT)
+        except disconnect_errors():
+            if attempt == retries or link_is_up(browser):
+                raise
+
+        await asyncio.sleep(random.uniform(0, min(2 ** attempt, RECONNECT_MAX_BACKOFF_S)))
+        async with _RECONNECT_LOCK:
+            if _BROWSER is not None and _BROWSER.is_connected():
+                continue  # Another request already reconnected
+            try:
+                ws_url = await asyncio.to_thread(ensure_chrome_running, _BROWSER_PORT)
+                await connect_browser(_PW, ws_url, _BROWSER_PORT)
+            except Exception:
+                pass  # Still unreachable — the next attempt fails fast and backs off again
+
+
+# ── Daemon mode ─────────────────────────────────────────────────
+
+def connect_daemon(path: str = DAEMON_SOCKET):
+    """Return a socket connected to a running daemon, or None if none is listening."""
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def send_to_daemon(request: dict, path: str = DAEMON_SOCKET):
+    """
+    Forward a request to a running daemon as one JSON line.
+
+    Returns the daemon's result, or None when no daemon is listening (or it
+    is attached to a different CDP port) so the caller can fall back to
+    connecting over CDP itself.
+    """
+    sock = connect_daemon(path)
+    if sock is None:
+        return None
+
+    with sock:
+        sock.settimeout(DAEMON_REPLY_TIMEOUT_S)
+        try:
+            sock.sendall(dump_json(request) + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except socket.timeout:
+            return {"success": False, "error": "daemon_timeout"}
+        except OSError:
+            line = b""
+
+    if not line:
+        return {"success": False, "error": "daemon_disconnected"}
+    try:
+        result = json.loads(line)
+    except ValueError:
+        return {"success": False, "error": "daemon_bad_reply"}
+    if result.get("error") == "daemon_port_mismatch":
+        return None
+    return result
+
+
+async def _skip_line(reader):
+    """Discard input up to and including the next newline (or EOF)."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+async def handle_daemon_client(reader, writer):
+    """Serve JSON-line requests from one client until it disconnects."""
+    try:
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                line = e.partial  # EOF; empty when the client hung up between requests
+            except asyncio.LimitOverrunError:
+                # Read the whole line before replying: closing on unread input
+                # would reset the connection and lose the error.
+                await _skip_line(reader)
+                writer.write(dump_result({"success": False, "error": "daemon_request_too_large"}) + b"\n")
+                await writer.drain()
+                continue
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                port = request.get("cdp_port", _BROWSER_PORT)
+                if port != _BROWSER_PORT:
+                    result = {"success": False, "error": "daemon_port_mismatch", "daemon_port": _BROWSER_PORT}
+                else:
+                    result = await run_request(request)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            writer.write(dump_result(result) + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve_daemon(path: str = DAEMON_SOCKET):
+    """Listen on a Unix socket and serve requests with the warm browser."""
+    global _POOL_PAGES
+    sock = connect_daemon(path)
+    if sock is not None:
+        sock.close()
+        emit({"success": False, "error": "daemon_already_running", "socket": path})
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)  # Stale socket left by a daemon that didn't exit cleanly
+
+    _POOL_PAGES = True
+    server = await asyncio.start_unix_server(handle_daemon_client, path=path, limit=DAEMON_LINE_LIMIT)
+    emit({"success": True, "daemon": "listening", "socket": path})
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+        await drain_page_pool()
+
+
 # ── Main ────────────────────────────────────────────────────────
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="Stealth browse via Patchright + CDP")
-    parser.add_argument("--url", required=True, help="Target URL")
+    parser.add_argument("--url", default=None, help="Target URL")
+    parser.add_argument("--urls", nargs="+", default=[],
+                        help="Multiple target URLs, processed concurrently in separate tabs")
     parser.add_argument("--action", default="read", choices=["read", "screenshot", "interact"],
                         help="Action to perform")
     parser.add_argument("--selectors", nargs="*", default=[], help="CSS selectors")
     parser.add_argument("--wait-for", default=None, help="CSS selector to wait for before extracting")
     parser.add_argument("--wait-timeout", type=int, default=15000, help="Timeout in ms for --wait-for")
+    parser.add_argument("--no-images", action="store_true",
+                        help="screenshot: skip loading images, fonts, media and analytics")
+    parser.add_argument("--parallel-clicks", action="store_true",
+                        help="interact: overlap the pauses between clicks on independent selectors "
+                             "(the clicks themselves still run one at a time)")
+    parser.add_argument("--full-risk-scan", action="store_true",
+                        help="Scan up to the first 200k characters of visible text for risk-control "
+                             "keywords instead of the first 64k")
     parser.add_argument("--cdp-port", type=int, default=CDP_PORT, help="CDP port")
+    parser.add_argument("--daemon", action="store_true",
+                        help=f"Keep the CDP connection warm and serve JSON-line requests on {DAEMON_SOCKET}")
     args = parser.parse_args()
 
+    request = {
+        "action": args.action,
+        "url": args.url,
+        "urls": args.urls,
+        "selectors": args.selectors,
+        "wait_for": args.wait_for,
+        "wait_timeout": args.wait_timeout,
+        "no_images": args.no_images,
+        "parallel_clicks": args.parallel_clicks,
+        "full_risk_scan": args.full_risk_scan,
+        "cdp_port": args.cdp_port,
+    }
+
+    if not args.daemon:
+        if not args.url and not args.urls:
+            parser.error("one of --url or --urls is required")
+
+        # A running daemon already holds a warm connection — hand the request over
+        result = send_to_daemon(request)
+        if result is not None:
+            emit(result, indent=True)
+            return
+
+    # Start Chrome first so its launch overlaps the (slow) patchright import
+    try:
+        launcher = start_chrome(args.cdp_port)
+    except Exception as e:
+        emit({"success": False, "error": f"chrome_launch_failed: {e}"})
+        sys.exit(1)
+
     # Ensure patchright is installed
     try:
-        from patchright.sync_api import sync_playwright
+        from patchright.async_api import async_playwright
     except ImportError:
-        print(json.dumps({
+        emit({
             "success": False,
             "error": "patchright_not_installed",
             "fix": "pip3 install patchright && python3 -m patchright install chromium",
-        }))
+        })
         sys.exit(1)
 
     # Ensure Chrome is running with CDP
     try:
-        ws_url = ensure_chrome_running()
+        ws_url = wait_for_ws(args.cdp_port, launcher)
     except Exception as e:
-        print(json.dumps({"success": False, "error": f"chrome_launch_failed: {e}"}))
+        emit({"success": False, "error": f"chrome_launch_failed: {e}"})
         sys.exit(1)
 
     # Connect via Patchright
-    with sync_playwright() as pw:
+    async with async_playwright() as pw:
         try:
-            browser = pw.chromium.connect_over_cdp(ws_url)
+            context = await connect_browser(pw, ws_url, args.cdp_port)
         except Exception as e:
-            print(json.dumps({"success": False, "error": f"cdp_connect_failed: {e}"}))
+            emit({"success": False, "error": f"cdp_connect_failed: {e}"})
             sys.exit(1)
 
-        # CRITICAL: Use Chrome's existing default context, NOT new_context()
-        contexts = browser.contexts
-        if not contexts:
-            print(json.dumps({"success": False, "error": "no_browser_context_found"}))
+        if context is None:
+            emit({"success": False, "error": "no_browser_context_found"})
             sys.exit(1)
 
-        context = contexts[0]
-        page = context.new_page()
-
-        try:
-            if args.action == "read":
-                result = action_read(page, args.url, args.selectors, args.wait_for, args.wait_timeout)
-            elif args.action == "screenshot":
-                result = action_screenshot(page, args.url)
-            elif args.action == "interact":
-                result = action_interact(page, args.url, args.selectors)
-            else:
-                result = {"success": False, "error": f"unknown_action: {args.action}"}
-        except Exception as e:
-            result = {"success": False, "error": str(e)}
-        finally:
-            page.close()
+        if args.daemon:
+            await serve_daemon()
+            return
 
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        result = await run_request(request)
+        emit(result, indent=True)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
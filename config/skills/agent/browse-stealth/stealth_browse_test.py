@@ -0,0 +1,134 @@
+"""Tests for stealth-browse.py resource blocking (no browser needed)."""
+
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def stealth_browse(tmp_path_factory):
+    """Load stealth-browse.py with HOME and no_proxy sandboxed.
+
+    Importing the script creates ~/.crewly/screenshots and sets no_proxy;
+    both are confined to this fixture.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(tmp_path_factory.mktemp("home")))
+        mp.setenv("no_proxy", os.environ.get("no_proxy", ""))
+        spec = importlib.util.spec_from_file_location(
+            "stealth_browse", os.path.join(os.path.dirname(os.path.abspath(__file__)), "stealth-browse.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+class FakeCDPSession:
+    """Records CDP commands and event handlers."""
+
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params))
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class FakeContext:
+    def __init__(self):
+        self.sessions = []
+
+    async def new_cdp_session(self, page):
+        cdp = FakeCDPSession()
+        self.sessions.append(cdp)
+        return cdp
+
+
+class FakePage:
+    def __init__(self):
+        self.context = FakeContext()
+
+
+def test_block_resources_sends_tracker_urls_and_resource_type_patterns(stealth_browse):
+    page = FakePage()
+    asyncio.run(stealth_browse.block_resources(page))
+
+    [cdp] = page.context.sessions
+    assert cdp.sent == [
+        ("Network.enable", None),
+        ("Network.setBlockedURLs", {"urls": [
+            "*://*.googletagmanager.com/*",
+            "*://*.google-analytics.com/*",
+            "*://*.doubleclick.net/*",
+        ]}),
+        ("Fetch.enable", {"patterns": [
+            {"urlPattern": "*", "resourceType": "Image", "requestStage": "Request"},
+            {"urlPattern": "*", "resourceType": "Media", "requestStage": "Request"},
+            {"urlPattern": "*", "resourceType": "Font", "requestStage": "Request"},
+        ]}),
+    ]
+
+
+def test_paused_request_is_failed(stealth_browse):
+    page = FakePage()
+    asyncio.run(stealth_browse.block_resources(page))
+
+    [cdp] = page.context.sessions
+    cdp.sent.clear()
+    handler = cdp.handlers["Fetch.requestPaused"]
+    asyncio.run(handler({"requestId": "interception-1", "resourceType": "Image"}))
+
+    assert cdp.sent == [
+        ("Fetch.failRequest", {"requestId": "interception-1", "errorReason": "BlockedByClient"}),
+    ]
+
+
+def test_unblock_resources_reuses_session_and_clears_blocking(stealth_browse):
+    page = FakePage()
+
+    async def block_then_unblock():
+        await stealth_browse.block_resources(page)
+        page.context.sessions[0].sent.clear()
+        await stealth_browse.unblock_resources(page)
+
+    asyncio.run(block_then_unblock())
+
+    [cdp] = page.context.sessions
+    assert cdp.sent == [
+        ("Fetch.disable", None),
+        ("Network.setBlockedURLs", {"urls": []}),
+    ]
+
+
+def test_unblock_resources_without_blocking_is_a_no_op(stealth_browse):
+    page = FakePage()
+    asyncio.run(stealth_browse.unblock_resources(page))
+    assert page.context.sessions == []
+
+
+class FakeTextPage:
+    """Page whose visible text is fixed; evaluate() applies the script's slice."""
+
+    def __init__(self, text):
+        self.text = text
+
+    async def evaluate(self, script, n):
+        return self.text[:n]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("请完成滑块验证码", {"keyword:验证码", "keyword:滑块验证"}),
+    ("人机验证码", {"keyword:验证码", "keyword:人机验证"}),
+    ("Please complete the CAPTCHA", {"keyword:captcha"}),
+    ("Nothing to see here", set()),
+])
+def test_detect_risk_control_reports_overlapping_keywords(stealth_browse, text, expected):
+    page = FakeTextPage(text)
+    risk = asyncio.run(stealth_browse.detect_risk_control(page, "https://example.com/"))
+    assert set(risk["signals"]) == expected
+    assert risk["detected"] == bool(expected)